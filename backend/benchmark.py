@@ -0,0 +1,106 @@
+import argparse
+import asyncio
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional
+
+try:
+    from .models import TaskMeta, BuildProfile, DEFAULT_BUILD_PROFILES
+    from .runner import Runner
+    from .topology import CpuSlot, detect_topology, parse_cpu_list
+except ImportError:
+    from models import TaskMeta, BuildProfile, DEFAULT_BUILD_PROFILES
+    from runner import Runner
+    from topology import CpuSlot, detect_topology, parse_cpu_list
+
+BASE_DIR = Path(__file__).resolve().parent
+TASKS_DIR = os.getenv("TASKS_DIR", str(BASE_DIR.parent / "tasks"))
+RUNNER_IMAGE = os.getenv("RUNNER_IMAGE", "zig-runner:0.13.0")
+OPTIMIZE_MODES = ["Debug", "ReleaseSafe", "ReleaseFast", "ReleaseSmall"]
+
+
+def _collect_profiles(meta: TaskMeta) -> Dict[str, BuildProfile]:
+    profiles: Dict[str, BuildProfile] = {
+        mode: BuildProfile(optimize=mode) for mode in OPTIMIZE_MODES
+    }
+    for mode in DEFAULT_BUILD_PROFILES:
+        profiles[f"{mode} (task)"] = meta.build_profile(mode)
+    return profiles
+
+
+def _benchmark_slot(cpuset: Optional[str]) -> Optional[CpuSlot]:
+    """Pick CPUs that live workers do not use, so neither side skews the other."""
+    if cpuset:
+        return CpuSlot(0, parse_cpu_list(cpuset))
+    syntax_slot = detect_topology().syntax_slot
+    if syntax_slot is None:
+        print("No spare core to pin to, running unpinned (use --cpuset to pick CPUs)")
+    return syntax_slot
+
+
+async def _benchmark(
+    task_id: str,
+    code: str,
+    as_json: bool,
+    repeat: int,
+    cpuset: Optional[str]
+) -> None:
+    runner = Runner(docker_image=RUNNER_IMAGE, tasks_dir=TASKS_DIR)
+    meta = runner.load_task_meta(task_id)
+    slot = _benchmark_slot(cpuset)
+
+    reports = {}
+    for name, profile in _collect_profiles(meta).items():
+        reports[name] = await runner.benchmark_profile(
+            task_id, code, profile, slot=slot, repeat=repeat
+        )
+
+    if as_json:
+        print(json.dumps(reports, indent=2))
+        return
+
+    print(
+        f"{'profile':<22} {'compile ms':>10} {'run ms':>10} {'max ms':>8} "
+        f"{'wall ms':>10} {'passed':>8}  flags"
+    )
+    for name, report in reports.items():
+        run_ms = report["run_ms"]
+        total_run = sum(run_ms)
+        max_run = max(run_ms) if run_ms else 0
+        total_wall = sum(report["wall_ms"])
+        passed = f"{report['passed']}/{report['tests']}" if report["compiled"] else "CE"
+        print(
+            f"{name:<22} {report['compile_ms']:>10.0f} {total_run:>10.0f} "
+            f"{max_run:>8.0f} {total_wall:>10.0f} {passed:>8}  {' '.join(report['flags'])}"
+        )
+    print(f"run/max ms: median binary time over {repeat} runs; wall ms includes docker startup")
+    print(f"time_limit_ms per test: {meta.time_limit_ms}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare compile time vs run time of build profiles on a task's tests"
+    )
+    parser.add_argument("task_id")
+    parser.add_argument("solution", nargs="?", help="path to main.zig (defaults to the task starter code)")
+    parser.add_argument("--json", action="store_true", help="print raw reports as JSON")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per test, the median is reported")
+    parser.add_argument("--cpuset", help="CPUs to pin to, e.g. 6,7 (defaults to the spare syntax core)")
+    args = parser.parse_args()
+
+    if args.solution:
+        with open(args.solution, encoding="utf-8") as f:
+            code = f.read()
+    else:
+        meta_path = Path(TASKS_DIR) / args.task_id / "meta.json"
+        with open(meta_path, encoding="utf-8") as f:
+            code = json.load(f).get("starter_code") or ""
+        if not code:
+            parser.error("task has no starter_code, pass a solution file")
+
+    asyncio.run(_benchmark(args.task_id, code, args.json, args.repeat, args.cpuset))
+
+
+if __name__ == "__main__":
+    main()
@@ -5,13 +5,19 @@ from typing import Dict, List, Optional
 from collections import deque
 
 try:
-    from .models import JobState, JobStatus, JobResult
+    from .models import JobState, JobStatus, JobResult, Verdict
     from .runner import Runner
+    from .topology import CpuSlot, available_cpus
 except ImportError:
-    from models import JobState, JobStatus, JobResult
+    from models import JobState, JobStatus, JobResult, Verdict
     from runner import Runner
+    from topology import CpuSlot, available_cpus
 
 DEFAULT_AVG_DURATION_MS = 3000
+DEFAULT_AVG_COMPILE_MS = 2000
+SYNTAX_WORKER_RATIO = 4
+SYNTAX_QUEUE_PER_WORKER = 4
+UNPINNED_WORKERS_PER_CPU = 2
 RECENT_DURATION_WINDOW = 20
 
 
@@ -30,20 +36,46 @@ class Job:
 class JobManager:
     def __init__(
         self,
-        max_workers: int = 2,
+        max_workers: Optional[int] = 2,
         max_queue: int = 200,
-        job_ttl_minutes: int = 30
+        job_ttl_minutes: int = 30,
+        syntax_workers: Optional[int] = None,
+        slots: Optional[List[CpuSlot]] = None,
+        syntax_slot: Optional[CpuSlot] = None
     ):
+        self.slots = slots or []
+        self.syntax_slot = syntax_slot
+        if not max_workers:
+            max_workers = len(self.slots) or len(available_cpus()) * UNPINNED_WORKERS_PER_CPU
+        elif self.slots and max_workers > len(self.slots):
+            print(
+                f"MAX_WORKERS={max_workers} exceeds {len(self.slots)} pinned CPU slots, "
+                f"capping workers at {len(self.slots)}"
+            )
+            max_workers = len(self.slots)
         self.max_workers = max_workers
+        if syntax_workers is None:
+            syntax_workers = max(1, max_workers // SYNTAX_WORKER_RATIO)
+        self.syntax_workers = syntax_workers
         self.max_queue = max_queue
         self.job_ttl = timedelta(minutes=job_ttl_minutes)
 
         self.queue: asyncio.Queue = asyncio.Queue()
+        self.syntax_queue: asyncio.Queue = asyncio.Queue()
         self.jobs: Dict[str, Job] = {}
         self.queued_order: deque[str] = deque()
         self.queued_set: set[str] = set()
         self.recent_durations: deque[float] = deque(maxlen=RECENT_DURATION_WINDOW)
+        self.recent_compile_durations: deque[float] = deque(maxlen=RECENT_DURATION_WINDOW)
+        self.busy_workers = 0
         self.lock = asyncio.Lock()
+        self.syntax_stats = {
+            "checked": 0,
+            "rejected": 0,
+            "bypassed": 0,
+            "check_time_ms": 0.0,
+            "saved_time_ms": 0.0
+        }
 
         self.workers: List[asyncio.Task] = []
         self.running = False
@@ -55,8 +87,11 @@ class JobManager:
 
         self.running = True
         self.workers = [
-            asyncio.create_task(self._worker_loop(i))
+            asyncio.create_task(self._worker_loop(i, self._slot_for_worker(i)))
             for i in range(self.max_workers)
+        ] + [
+            asyncio.create_task(self._syntax_worker_loop(i))
+            for i in range(self.syntax_workers)
         ]
 
         asyncio.create_task(self._ttl_cleanup_loop())
@@ -66,10 +101,15 @@ class JobManager:
 
         for _ in range(self.max_workers):
             self.queue.put_nowait(None)
+        for _ in range(self.syntax_workers):
+            self.syntax_queue.put_nowait(None)
 
         await asyncio.gather(*self.workers, return_exceptions=True)
         self.workers.clear()
 
+        if self.runner:
+            await self.runner.stop_syntax_container()
+
     async def submit(self, task_id: str, code: str, mode: str = "check") -> str:
         async with self.lock:
             if len(self.queued_order) >= self.max_queue:
@@ -82,9 +122,61 @@ class JobManager:
             self.queued_order.append(job_id)
             self.queued_set.add(job_id)
 
-        await self.queue.put(job_id)
+            use_syntax_lane = self._should_use_syntax_lane()
+            if self.syntax_workers > 0 and not use_syntax_lane:
+                self.syntax_stats["bypassed"] += 1
+
+        if use_syntax_lane:
+            await self.syntax_queue.put(job_id)
+        else:
+            await self.queue.put(job_id)
         return job_id
 
+    def get_syntax_stats(self) -> dict:
+        checked = self.syntax_stats["checked"]
+        rejected = self.syntax_stats["rejected"]
+        return {
+            "workers": self.syntax_workers,
+            "checked": checked,
+            "rejected": rejected,
+            "bypassed": self.syntax_stats["bypassed"],
+            "hit_rate": rejected / checked if checked else 0.0,
+            "avg_check_ms": self.syntax_stats["check_time_ms"] / checked if checked else 0.0,
+            "saved_time_ms": int(self.syntax_stats["saved_time_ms"])
+        }
+
+    def _should_use_syntax_lane(self) -> bool:
+        if self.syntax_workers <= 0:
+            return False
+        # An idle full worker gives CE as fast as the lane would, so skip it.
+        idle_workers = self.max_workers - self.busy_workers - self.queue.qsize()
+        if idle_workers > 0:
+            return False
+        # Don't let a burst pile up behind the lane while it is saturated.
+        return self.syntax_queue.qsize() < self.syntax_workers * SYNTAX_QUEUE_PER_WORKER
+
+    def _take_syntax_job(self) -> Optional[str]:
+        # Idle full workers drain the lane instead of waiting behind it.
+        if not self.queue.empty() or self.syntax_queue.empty():
+            return None
+        job_id = self.syntax_queue.get_nowait()
+        if job_id is None:
+            self.syntax_queue.put_nowait(None)
+            return None
+        self.syntax_stats["bypassed"] += 1
+        return job_id
+
+    def get_slots(self) -> dict:
+        return {
+            "workers": [slot.to_dict() for slot in self.slots],
+            "syntax": self.syntax_slot.to_dict() if self.syntax_slot else None
+        }
+
+    def _slot_for_worker(self, worker_id: int) -> Optional[CpuSlot]:
+        if worker_id >= len(self.slots):
+            return None
+        return self.slots[worker_id]
+
     async def get_job(self, job_id: str) -> Optional[JobStatus]:
         async with self.lock:
             job = self.jobs.get(job_id)
@@ -133,10 +225,12 @@ class JobManager:
 
             return True
 
-    async def _worker_loop(self, worker_id: int):
+    async def _worker_loop(self, worker_id: int, slot: Optional[CpuSlot] = None):
         while self.running:
             try:
-                job_id = await asyncio.wait_for(self.queue.get(), timeout=1.0)
+                job_id = self._take_syntax_job()
+                if job_id is None:
+                    job_id = await asyncio.wait_for(self.queue.get(), timeout=1.0)
 
                 if job_id is None:
                     break
@@ -148,6 +242,7 @@ class JobManager:
 
                     job.state = JobState.RUNNING
                     job.started_at = datetime.now()
+                    self.busy_workers += 1
                     if job_id in self.queued_set:
                         self.queued_set.remove(job_id)
                     if job_id in self.queued_order:
@@ -160,7 +255,8 @@ class JobManager:
                     result = await self.runner.execute_job(
                         job.request["task_id"],
                         job.request["code"],
-                        job.request["mode"]
+                        job.request["mode"],
+                        slot=slot
                     )
 
                     async with self.lock:
@@ -168,6 +264,8 @@ class JobManager:
                         job.state = JobState.DONE
                         job.finished_at = datetime.now()
                         self._record_duration(job)
+                        if result.verdict == Verdict.CE:
+                            self.recent_compile_durations.append(result.time_ms)
 
                 except Exception as e:
                     async with self.lock:
@@ -175,12 +273,71 @@ class JobManager:
                         job.error_message = str(e)
                         job.finished_at = datetime.now()
                         self._record_duration(job)
+                finally:
+                    async with self.lock:
+                        self.busy_workers -= 1
 
             except asyncio.TimeoutError:
                 continue
             except Exception as e:
                 print(f"Worker {worker_id} error: {e}")
 
+    async def _syntax_worker_loop(self, worker_id: int):
+        while self.running:
+            try:
+                job_id = await asyncio.wait_for(self.syntax_queue.get(), timeout=1.0)
+
+                if job_id is None:
+                    break
+
+                async with self.lock:
+                    job = self.jobs.get(job_id)
+                    if not job or job.state != JobState.QUEUED:
+                        continue
+
+                result = None
+                try:
+                    if not self.runner:
+                        raise RuntimeError("Runner is not initialized")
+
+                    result, check_ms = await self.runner.check_syntax(
+                        job.request["code"],
+                        slot=self.syntax_slot
+                    )
+                    async with self.lock:
+                        self.syntax_stats["checked"] += 1
+                        self.syntax_stats["check_time_ms"] += check_ms
+                except Exception as e:
+                    print(f"Syntax worker {worker_id} error: {e}")
+
+                if result is None:
+                    await self.queue.put(job_id)
+                    continue
+
+                async with self.lock:
+                    if job.state != JobState.QUEUED:
+                        continue
+
+                    self.syntax_stats["rejected"] += 1
+                    self.syntax_stats["saved_time_ms"] += max(
+                        0.0, self._average_compile_ms() - result.time_ms
+                    )
+
+                    now = datetime.now()
+                    job.result = result
+                    job.state = JobState.DONE
+                    job.started_at = now
+                    job.finished_at = now
+                    if job_id in self.queued_set:
+                        self.queued_set.remove(job_id)
+                    if job_id in self.queued_order:
+                        self.queued_order.remove(job_id)
+
+            except asyncio.TimeoutError:
+                continue
+            except Exception as e:
+                print(f"Syntax worker {worker_id} error: {e}")
+
     async def _ttl_cleanup_loop(self):
         while self.running:
             await asyncio.sleep(300)
@@ -214,6 +371,12 @@ class JobManager:
             return DEFAULT_AVG_DURATION_MS
         return sum(self.recent_durations) / len(self.recent_durations)
 
+    def _average_compile_ms(self) -> float:
+        # CE jobs in the full pipeline only pay for the compile.
+        if not self.recent_compile_durations:
+            return DEFAULT_AVG_COMPILE_MS
+        return sum(self.recent_compile_durations) / len(self.recent_compile_durations)
+
     def _record_duration(self, job: Job) -> None:
         if not job.started_at or not job.finished_at:
             return
@@ -8,25 +8,33 @@ try:
     from .models import TaskMeta, SubmitRequest, JobStatus
     from .job_manager import JobManager
     from .runner import Runner
+    from .topology import detect_topology
 except ImportError:
     from models import TaskMeta, SubmitRequest, JobStatus
     from job_manager import JobManager
     from runner import Runner
+    from topology import detect_topology
 
 app = FastAPI(title="Zig Exercise Runner")
 
 BASE_DIR = Path(__file__).resolve().parent
 TASKS_DIR = os.getenv("TASKS_DIR", str(BASE_DIR.parent / "tasks"))
 RUNNER_IMAGE = os.getenv("RUNNER_IMAGE", "zig-runner:0.13.0")
-MAX_WORKERS = int(os.getenv("MAX_WORKERS", "2"))
+MAX_WORKERS = int(os.getenv("MAX_WORKERS", "0"))
+CPU_PINNING = os.getenv("CPU_PINNING", "1") == "1"
+SYNTAX_WORKERS = int(os.environ["SYNTAX_WORKERS"]) if os.getenv("SYNTAX_WORKERS") else None
 MAX_QUEUE = int(os.getenv("MAX_QUEUE", "200"))
 JOB_TTL_MINUTES = int(os.getenv("JOB_TTL_MINUTES", "30"))
 CODE_MAX_BYTES = int(os.getenv("CODE_MAX_BYTES", "131072"))
 
+topology = detect_topology(reserve_syntax_core=SYNTAX_WORKERS != 0) if CPU_PINNING else None
 job_manager = JobManager(
     max_workers=MAX_WORKERS,
     max_queue=MAX_QUEUE,
-    job_ttl_minutes=JOB_TTL_MINUTES
+    job_ttl_minutes=JOB_TTL_MINUTES,
+    syntax_workers=SYNTAX_WORKERS,
+    slots=topology.slots if topology else None,
+    syntax_slot=topology.syntax_slot if topology else None
 )
 runner = Runner(docker_image=RUNNER_IMAGE, tasks_dir=TASKS_DIR)
 job_manager.runner = runner
@@ -163,5 +171,7 @@ async def health_check():
         "status": "healthy",
         "workers": job_manager.max_workers,
         "queue_size": len(job_manager.queued_order),
-        "jobs_count": len(job_manager.jobs)
+        "jobs_count": len(job_manager.jobs),
+        "slots": job_manager.get_slots(),
+        "syntax_check": job_manager.get_syntax_stats()
     }
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Optional, List, Dict, Literal
 from datetime import datetime
 from enum import Enum
 
@@ -16,6 +16,25 @@ class JobState(str, Enum):
     DONE = "done"
     ERROR = "error"
 
+class BuildProfile(BaseModel):
+    optimize: Literal["Debug", "ReleaseSafe", "ReleaseFast", "ReleaseSmall"] = "ReleaseSmall"
+    extra_flags: List[str] = []
+    single_threaded: bool = False
+    target_cpu: Optional[str] = None
+
+    def build_flags(self) -> List[str]:
+        flags = ["-O", self.optimize]
+        if self.single_threaded:
+            flags.append("-fsingle-threaded")
+        if self.target_cpu:
+            flags.append(f"-mcpu={self.target_cpu}")
+        return flags + self.extra_flags
+
+DEFAULT_BUILD_PROFILES: Dict[str, BuildProfile] = {
+    "run": BuildProfile(optimize="Debug"),
+    "check": BuildProfile(optimize="ReleaseSmall"),
+}
+
 class TaskMeta(BaseModel):
     id: str
     title: str
@@ -24,6 +43,14 @@ class TaskMeta(BaseModel):
     time_limit_ms: int
     memory_mb: int
     starter_code: Optional[str] = None
+    build_profiles: Dict[str, BuildProfile] = {}
+
+    def build_profile(self, mode: str) -> BuildProfile:
+        default = DEFAULT_BUILD_PROFILES.get(mode, DEFAULT_BUILD_PROFILES["check"])
+        override = self.build_profiles.get(mode)
+        if override is None:
+            return default
+        return default.model_copy(update=override.model_dump(exclude_unset=True))
 
 class SubmitRequest(BaseModel):
     task_id: str
@@ -3,38 +3,49 @@ import tempfile
 import shutil
 import os
 import json
+import statistics
 import time
+import uuid
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 try:
-    from .models import Verdict, TestResult, JobResult
+    from .models import Verdict, TestResult, JobResult, TaskMeta, BuildProfile
+    from .topology import CpuSlot
 except ImportError:
-    from models import Verdict, TestResult, JobResult
+    from models import Verdict, TestResult, JobResult, TaskMeta, BuildProfile
+    from topology import CpuSlot
 
-DEFAULT_PER_TEST_TIMEOUT_MS = 3000
-DOCKER_MEMORY_LIMIT = "512m"
+DOCKER_MEMORY_LIMIT_MB = 512
 DOCKER_CPU_LIMIT = "1"
 DOCKER_PIDS_LIMIT = "128"
 DOCKER_TIMEOUT_EXIT_CODE = 124
 DOCKER_NOT_FOUND_EXIT_CODE = 127
 CONTAINER_GRACE_MS = 2000
+SYNTAX_CHECK_TIMEOUT_MS = 1000
+SYNTAX_CONTAINER_START_TIMEOUT_MS = 10000
+ZIG_ERROR_EXIT_CODE = 1
+TIMED_RUN_COMMAND = ["bash", "-c", "TIMEFORMAT=%R; time /workspace/main"]
 
 
 class Runner:
     def __init__(self, docker_image: str, tasks_dir: str):
         self.image = docker_image
         self.tasks_dir = tasks_dir
+        self.syntax_container: Optional[str] = None
+        self.syntax_container_lock = asyncio.Lock()
 
     async def execute_job(
         self,
         task_id: str,
         code: str,
-        mode: str = "check"
+        mode: str = "check",
+        slot: Optional[CpuSlot] = None
     ) -> JobResult:
-        meta = self._load_task_meta(task_id)
-        per_test_timeout_ms = int(meta.get("time_limit_ms", DEFAULT_PER_TEST_TIMEOUT_MS))
+        meta = self.load_task_meta(task_id)
+        per_test_timeout_ms = meta.time_limit_ms
         compile_timeout_ms = max(10000, per_test_timeout_ms * 2)
+        profile = meta.build_profile(mode)
         tests = self._load_tests(task_id)
         overall_timeout_ms = self._calculate_overall_timeout_ms(per_test_timeout_ms, len(tests))
 
@@ -45,7 +56,9 @@ class Runner:
             compile_log, compile_time_ms, compile_stdout, compile_stderr, compile_exit = await self._compile(
                 code,
                 temp_dir,
-                compile_timeout_ms
+                compile_timeout_ms,
+                profile,
+                slot=slot
             )
 
             if compile_exit != 0:
@@ -62,7 +75,8 @@ class Runner:
                 stdout, stderr, exit_code, exec_time = await self._run_binary(
                     temp_dir,
                     "",
-                    per_test_timeout_ms + CONTAINER_GRACE_MS
+                    per_test_timeout_ms + CONTAINER_GRACE_MS,
+                    slot=slot
                 )
                 verdict = Verdict.OK if exit_code == 0 else (
                     Verdict.TLE if exit_code == DOCKER_TIMEOUT_EXIT_CODE else Verdict.RE
@@ -93,7 +107,8 @@ class Runner:
                 stdout, stderr, exit_code, exec_time = await self._run_binary(
                     temp_dir,
                     input_data,
-                    per_test_timeout_ms + CONTAINER_GRACE_MS
+                    per_test_timeout_ms + CONTAINER_GRACE_MS,
+                    slot=slot
                 )
                 total_time_ms += exec_time
 
@@ -138,7 +153,175 @@ class Runner:
         finally:
             shutil.rmtree(temp_dir, ignore_errors=True)
 
-    async def _compile(self, code: str, work_dir: str, timeout_ms: int) -> Tuple[str, float, str, str, int]:
+    async def check_syntax(
+        self,
+        code: str,
+        slot: Optional[CpuSlot] = None
+    ) -> Tuple[Optional[JobResult], float]:
+        """Parse the code with `zig ast-check` before the full build.
+
+        The check runs via `docker exec` in a long-lived lane container, so
+        it costs no container start. Returns a CE result when the code does
+        not parse, otherwise None so the job is admitted to the full
+        pipeline. Timeouts and docker failures also return None: the full
+        compile will report them.
+        """
+        container = await self._ensure_syntax_container(slot)
+        if not container:
+            return None, 0.0
+
+        stdout, stderr, exit_code, duration_ms = await self._run_process(
+            ["docker", "exec", "-i", container, "zig", "ast-check"],
+            input_data=code,
+            timeout_ms=SYNTAX_CHECK_TIMEOUT_MS
+        )
+
+        if not self._is_syntax_error(exit_code, stderr):
+            if exit_code not in (0, DOCKER_TIMEOUT_EXIT_CODE):
+                # The lane container is gone; start a fresh one next time.
+                self.syntax_container = None
+            return None, duration_ms
+
+        return JobResult(
+            verdict=Verdict.CE,
+            stdout=stdout,
+            stderr=stderr,
+            compile_log=stderr,
+            time_ms=duration_ms,
+            test_results=[]
+        ), duration_ms
+
+    async def stop_syntax_container(self) -> None:
+        async with self.syntax_container_lock:
+            if not self.syntax_container:
+                return
+            await self._run_process(
+                ["docker", "rm", "-f", self.syntax_container],
+                input_data="",
+                timeout_ms=SYNTAX_CONTAINER_START_TIMEOUT_MS
+            )
+            self.syntax_container = None
+
+    async def _ensure_syntax_container(self, slot: Optional[CpuSlot]) -> Optional[str]:
+        async with self.syntax_container_lock:
+            if self.syntax_container:
+                return self.syntax_container
+
+            name = f"zig_syntax_{uuid.uuid4().hex[:12]}"
+            docker_command = [
+                "docker",
+                "run",
+                "-d",
+                "--rm",
+                "--name",
+                name,
+                *self._docker_limits(slot),
+                self.image,
+                "sleep",
+                "infinity"
+            ]
+            _, stderr, exit_code, _ = await self._run_process(
+                docker_command,
+                input_data="",
+                timeout_ms=SYNTAX_CONTAINER_START_TIMEOUT_MS
+            )
+            if exit_code != 0:
+                print(f"Syntax lane container failed to start: {stderr.strip()}")
+                return None
+
+            self.syntax_container = name
+            return name
+
+    def _is_syntax_error(self, exit_code: int, stderr: str) -> bool:
+        # `docker exec` also exits with 1 when the daemon rejects the call.
+        return (
+            exit_code == ZIG_ERROR_EXIT_CODE
+            and "error:" in stderr
+            and not stderr.startswith("Error response from daemon")
+        )
+
+    async def benchmark_profile(
+        self,
+        task_id: str,
+        code: str,
+        profile: BuildProfile,
+        slot: Optional[CpuSlot] = None,
+        repeat: int = 5
+    ) -> Dict[str, object]:
+        """Compile `code` with `profile` and time it on every task test.
+
+        Each test runs `repeat` times. `run_ms` holds the per-test median of
+        the binary's own run time, measured inside the container so docker
+        startup does not drown out the difference between profiles;
+        `wall_ms` holds the median including the container start.
+        """
+        meta = self.load_task_meta(task_id)
+        per_test_timeout_ms = meta.time_limit_ms
+        compile_timeout_ms = max(10000, per_test_timeout_ms * 2)
+        tests = self._load_tests(task_id)
+
+        temp_dir = tempfile.mkdtemp(prefix=f"zig_bench_{task_id}_")
+
+        try:
+            compile_log, compile_time_ms, _, _, compile_exit = await self._compile(
+                code,
+                temp_dir,
+                compile_timeout_ms,
+                profile,
+                slot=slot
+            )
+            report: Dict[str, object] = {
+                "flags": profile.build_flags(),
+                "compile_ms": compile_time_ms,
+                "compiled": compile_exit == 0,
+                "run_ms": [],
+                "wall_ms": [],
+                "passed": 0,
+                "tests": len(tests)
+            }
+            if compile_exit != 0:
+                report["compile_log"] = compile_log
+                return report
+
+            run_ms: List[float] = []
+            wall_ms: List[float] = []
+            passed = 0
+            for input_data, expected_output in tests:
+                inner_times: List[float] = []
+                wall_times: List[float] = []
+                ok = True
+                for _ in range(max(1, repeat)):
+                    stdout, stderr, exit_code, exec_time = await self._run_docker_command(
+                        command=TIMED_RUN_COMMAND,
+                        work_dir=temp_dir,
+                        input_data=input_data,
+                        timeout_ms=per_test_timeout_ms + CONTAINER_GRACE_MS,
+                        slot=slot
+                    )
+                    wall_times.append(exec_time)
+                    inner_times.append(self._parse_bash_time_ms(stderr, exec_time))
+                    if exit_code != 0 or not self._compare_output(stdout, expected_output):
+                        ok = False
+                run_ms.append(statistics.median(inner_times))
+                wall_ms.append(statistics.median(wall_times))
+                if ok:
+                    passed += 1
+
+            report["wall_ms"] = wall_ms
+            report["run_ms"] = run_ms
+            report["passed"] = passed
+            return report
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    async def _compile(
+        self,
+        code: str,
+        work_dir: str,
+        timeout_ms: int,
+        profile: BuildProfile,
+        slot: Optional[CpuSlot] = None
+    ) -> Tuple[str, float, str, str, int]:
         code_path = os.path.join(work_dir, "main.zig")
         with open(code_path, "w", encoding="utf-8") as f:
             f.write(code)
@@ -147,8 +330,7 @@ class Runner:
             "zig",
             "build-exe",
             "main.zig",
-            "-O",
-            "ReleaseSmall",
+            *profile.build_flags(),
             "-femit-bin=main"
         ]
 
@@ -156,7 +338,8 @@ class Runner:
             command=command,
             work_dir=work_dir,
             input_data="",
-            timeout_ms=timeout_ms
+            timeout_ms=timeout_ms,
+            slot=slot
         )
 
         compile_log = stderr if exit_code != 0 else ""
@@ -166,14 +349,16 @@ class Runner:
         self,
         work_dir: str,
         input_data: str,
-        timeout_ms: int
+        timeout_ms: int,
+        slot: Optional[CpuSlot] = None
     ) -> Tuple[str, str, int, float]:
         command = ["/workspace/main"]
         return await self._run_docker_command(
             command=command,
             work_dir=work_dir,
             input_data=input_data,
-            timeout_ms=timeout_ms
+            timeout_ms=timeout_ms,
+            slot=slot
         )
 
     async def _run_docker_command(
@@ -181,31 +366,55 @@ class Runner:
         command: List[str],
         work_dir: str,
         input_data: str,
-        timeout_ms: int
+        timeout_ms: int,
+        slot: Optional[CpuSlot] = None
     ) -> Tuple[str, str, int, float]:
         docker_command = [
             "docker",
             "run",
             "--rm",
+            *self._docker_limits(slot),
+            "-v",
+            f"{work_dir}:/workspace",
+            "-w",
+            "/workspace",
+            self.image
+        ] + command
+
+        return await self._run_process(docker_command, input_data, timeout_ms)
+
+    def _docker_limits(self, slot: Optional[CpuSlot]) -> List[str]:
+        memory_mb = DOCKER_MEMORY_LIMIT_MB
+        pinning = []
+        if slot:
+            pinning += ["--cpuset-cpus", slot.cpuset]
+            if slot.cpuset_mems:
+                pinning += ["--cpuset-mems", slot.cpuset_mems]
+            if slot.memory_mb:
+                memory_mb = min(memory_mb, slot.memory_mb)
+
+        return [
             "--network",
             "none",
             "--cpus",
             DOCKER_CPU_LIMIT,
             "--memory",
-            DOCKER_MEMORY_LIMIT,
+            f"{memory_mb}m",
             "--pids-limit",
             DOCKER_PIDS_LIMIT,
-            "-v",
-            f"{work_dir}:/workspace",
-            "-w",
-            "/workspace",
-            self.image
-        ] + command
+            *pinning
+        ]
 
+    async def _run_process(
+        self,
+        command: List[str],
+        input_data: str,
+        timeout_ms: int
+    ) -> Tuple[str, str, int, float]:
         start_time = time.monotonic()
         try:
             proc = await asyncio.create_subprocess_exec(
-                *docker_command,
+                *command,
                 stdin=asyncio.subprocess.PIPE,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE
@@ -231,6 +440,14 @@ class Runner:
             duration_ms = (time.monotonic() - start_time) * 1000
             return "", "Docker executable not found", DOCKER_NOT_FOUND_EXIT_CODE, duration_ms
 
+    def _parse_bash_time_ms(self, stderr: str, fallback_ms: float) -> float:
+        # `time` with TIMEFORMAT=%R prints elapsed seconds as the last stderr line.
+        lines = stderr.strip().splitlines()
+        try:
+            return float(lines[-1]) * 1000
+        except (IndexError, ValueError):
+            return fallback_ms
+
     def _compare_output(self, actual: str, expected: str) -> bool:
         actual_normalized = actual.replace("\r", "").rstrip(" \n")
         expected_normalized = expected.replace("\r", "").rstrip(" \n")
@@ -244,10 +461,10 @@ class Runner:
         elapsed_ms = (time.monotonic() - started_at) * 1000
         return elapsed_ms > overall_timeout_ms
 
-    def _load_task_meta(self, task_id: str) -> dict:
+    def load_task_meta(self, task_id: str) -> TaskMeta:
         meta_path = os.path.join(self.tasks_dir, task_id, "meta.json")
         with open(meta_path, encoding="utf-8") as f:
-            return json.load(f)
+            return TaskMeta(**json.load(f))
 
     def _load_tests(self, task_id: str) -> List[Tuple[str, str]]:
         test_dir = os.path.join(self.tasks_dir, task_id, "tests")
@@ -0,0 +1,64 @@
+import json
+
+from models import BuildProfile, TaskMeta
+from runner import Runner
+
+TASK = {
+    "id": "sum-two",
+    "title": "Sum",
+    "module": "basics",
+    "time_limit_ms": 2000,
+    "memory_mb": 128
+}
+
+
+def test_mode_defaults():
+    meta = TaskMeta(**TASK)
+
+    assert meta.build_profile("run").optimize == "Debug"
+    assert meta.build_profile("check").optimize == "ReleaseSmall"
+    assert meta.build_profile("unknown").optimize == "ReleaseSmall"
+
+
+def test_partial_override_keeps_mode_default():
+    meta = TaskMeta(**TASK, build_profiles={"run": {"single_threaded": True}})
+
+    profile = meta.build_profile("run")
+
+    assert profile.optimize == "Debug"
+    assert profile.single_threaded
+
+
+def test_full_override():
+    meta = TaskMeta(**TASK, build_profiles={
+        "check": {"optimize": "ReleaseFast", "target_cpu": "baseline", "extra_flags": ["-fstrip"]}
+    })
+
+    assert meta.build_profile("check").build_flags() == [
+        "-O", "ReleaseFast", "-mcpu=baseline", "-fstrip"
+    ]
+
+
+def test_build_flags():
+    profile = BuildProfile(optimize="Debug", single_threaded=True)
+
+    assert profile.build_flags() == ["-O", "Debug", "-fsingle-threaded"]
+
+
+def test_load_task_meta_returns_model(tmp_path):
+    task_dir = tmp_path / "sum-two"
+    task_dir.mkdir()
+    (task_dir / "meta.json").write_text(json.dumps(TASK))
+
+    meta = Runner(docker_image="img", tasks_dir=str(tmp_path)).load_task_meta("sum-two")
+
+    assert meta.time_limit_ms == 2000
+    assert meta.build_profile("run").optimize == "Debug"
+
+
+def test_parse_bash_time():
+    runner = Runner(docker_image="img", tasks_dir="tasks")
+
+    assert runner._parse_bash_time_ms("warning\n0.012\n", 500.0) == 12.0
+    assert runner._parse_bash_time_ms("", 500.0) == 500.0
+    assert runner._parse_bash_time_ms("panic: boom\n", 500.0) == 500.0
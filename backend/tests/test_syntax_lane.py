@@ -0,0 +1,128 @@
+import asyncio
+
+from job_manager import DEFAULT_AVG_COMPILE_MS, SYNTAX_QUEUE_PER_WORKER, JobManager
+from models import JobResult, JobState, Verdict
+from runner import Runner
+
+
+def _result(verdict: Verdict, time_ms: float) -> JobResult:
+    return JobResult(
+        verdict=verdict,
+        stdout="",
+        stderr="",
+        compile_log="",
+        time_ms=time_ms,
+        test_results=[]
+    )
+
+
+class FakeRunner:
+    def __init__(self, job_ms: float = 0.2):
+        self.job_ms = job_ms
+        self.executed = []
+
+    async def check_syntax(self, code, slot=None):
+        await asyncio.sleep(0.01)
+        if "bad" in code:
+            return _result(Verdict.CE, 40), 40
+        return None, 10
+
+    async def execute_job(self, task_id, code, mode, slot=None):
+        self.executed.append(code)
+        await asyncio.sleep(self.job_ms)
+        if "bad" in code:
+            return _result(Verdict.CE, 900)
+        return _result(Verdict.OK, 1500)
+
+    async def stop_syntax_container(self):
+        pass
+
+
+def test_lane_bypassed_while_workers_are_idle():
+    manager = JobManager(max_workers=2, syntax_workers=1, slots=None)
+
+    assert not manager._should_use_syntax_lane()
+
+    manager.busy_workers = 2
+    assert manager._should_use_syntax_lane()
+
+
+def test_lane_capped_when_saturated():
+    manager = JobManager(max_workers=1, syntax_workers=1, slots=None)
+    manager.busy_workers = 1
+    for i in range(SYNTAX_QUEUE_PER_WORKER):
+        manager.syntax_queue.put_nowait(f"job-{i}")
+
+    assert not manager._should_use_syntax_lane()
+
+
+def test_lane_disabled():
+    manager = JobManager(max_workers=1, syntax_workers=0, slots=None)
+    manager.busy_workers = 1
+
+    assert not manager._should_use_syntax_lane()
+
+
+def test_syntax_workers_scale_with_full_pool():
+    assert JobManager(max_workers=2).syntax_workers == 1
+    assert JobManager(max_workers=12).syntax_workers == 3
+
+
+def test_busy_workers_route_parse_errors_through_lane():
+    async def scenario():
+        runner = FakeRunner()
+        manager = JobManager(max_workers=1, syntax_workers=1, slots=None)
+        manager.runner = runner
+        await manager.start()
+        try:
+            first = await manager.submit("t", "good")
+            await asyncio.sleep(0.05)
+            bad = await manager.submit("t", "bad")
+            await asyncio.sleep(0.1)
+
+            status = await manager.get_job(bad)
+            assert status.state == JobState.DONE
+            assert status.result.verdict == Verdict.CE
+            assert "bad" not in runner.executed
+
+            await asyncio.sleep(0.3)
+            assert (await manager.get_job(first)).result.verdict == Verdict.OK
+            return manager.get_syntax_stats()
+        finally:
+            await manager.stop()
+
+    stats = asyncio.run(scenario())
+
+    assert stats["checked"] == 1
+    assert stats["rejected"] == 1
+    assert stats["bypassed"] == 1
+    assert stats["saved_time_ms"] == DEFAULT_AVG_COMPILE_MS - 40
+
+
+def test_saved_time_uses_full_pipeline_compile_time():
+    manager = JobManager(max_workers=1, slots=None)
+    manager.recent_durations.extend([5000, 7000])
+    manager.recent_compile_durations.extend([800, 1000])
+
+    assert manager._average_compile_ms() == 900
+
+
+def test_idle_worker_takes_job_from_lane():
+    manager = JobManager(max_workers=1, syntax_workers=1, slots=None)
+    manager.syntax_queue.put_nowait("queued-for-check")
+
+    assert manager._take_syntax_job() == "queued-for-check"
+    assert manager.syntax_stats["bypassed"] == 1
+
+    manager.syntax_queue.put_nowait(None)
+    assert manager._take_syntax_job() is None
+    assert manager.syntax_queue.get_nowait() is None
+
+
+def test_syntax_error_detection():
+    runner = Runner(docker_image="img", tasks_dir="tasks")
+
+    assert runner._is_syntax_error(1, "<stdin>:1:30: error: expected ';'\n")
+    assert not runner._is_syntax_error(0, "")
+    assert not runner._is_syntax_error(1, "Error response from daemon: No such container: x\n")
+    assert not runner._is_syntax_error(124, "")
@@ -0,0 +1,70 @@
+import pytest
+
+import topology
+from topology import detect_topology, format_cpu_list, parse_cpu_list
+
+
+def _fake_host(tmp_path, monkeypatch, cpus, siblings, nodes):
+    cpu_dir = tmp_path / "cpu"
+    node_dir = tmp_path / "node"
+    for cpu, sibling_list in siblings.items():
+        path = cpu_dir / f"cpu{cpu}" / "topology"
+        path.mkdir(parents=True)
+        (path / "thread_siblings_list").write_text(sibling_list)
+    for node, (cpulist, mem_kb) in nodes.items():
+        path = node_dir / f"node{node}"
+        path.mkdir(parents=True)
+        (path / "cpulist").write_text(cpulist)
+        (path / "meminfo").write_text(f"Node {node} MemTotal:  {mem_kb} kB\n")
+
+    monkeypatch.setattr(topology, "SYSFS_CPU_DIR", cpu_dir)
+    monkeypatch.setattr(topology, "SYSFS_NODE_DIR", node_dir)
+    monkeypatch.setattr(topology, "available_cpus", lambda: cpus)
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("0", [0]),
+    ("0-3", [0, 1, 2, 3]),
+    ("0-1,4,6-7\n", [0, 1, 4, 6, 7]),
+    ("", []),
+])
+def test_parse_cpu_list(value, expected):
+    assert parse_cpu_list(value) == expected
+
+
+def test_format_cpu_list_sorts():
+    assert format_cpu_list([4, 0, 5, 1]) == "0,1,4,5"
+
+
+def test_smt_siblings_share_one_slot(tmp_path, monkeypatch):
+    _fake_host(
+        tmp_path, monkeypatch,
+        cpus=list(range(8)),
+        siblings={cpu: f"{cpu % 4},{cpu % 4 + 4}" for cpu in range(8)},
+        nodes={0: ("0-7", 8 * 1024 * 1024)}
+    )
+
+    host = detect_topology()
+
+    assert [slot.cpuset for slot in host.slots] == ["0,4", "1,5", "2,6", "3,7"]
+    assert host.syntax_slot is None
+    assert all(slot.memory_mb == 2048 for slot in host.slots)
+
+
+def test_syntax_core_reserved_on_large_hosts_only_when_enabled(tmp_path, monkeypatch):
+    _fake_host(
+        tmp_path, monkeypatch,
+        cpus=list(range(8)),
+        siblings={cpu: str(cpu) for cpu in range(8)},
+        nodes={0: ("0-3", 4 * 1024 * 1024), 1: ("4-7", 4 * 1024 * 1024)}
+    )
+
+    host = detect_topology()
+    assert len(host.slots) == 7
+    assert host.syntax_slot.cpuset == "7"
+    assert host.syntax_slot.cpuset_mems == "1"
+    assert host.slots[0].memory_mb == 1024
+
+    host = detect_topology(reserve_syntax_core=False)
+    assert len(host.slots) == 8
+    assert host.syntax_slot is None
@@ -0,0 +1,165 @@
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+SYSFS_NODE_DIR = Path("/sys/devices/system/node")
+SYSFS_CPU_DIR = Path("/sys/devices/system/cpu")
+SYNTAX_CORE_MIN_CORES = 8
+
+
+class CpuSlot:
+    """Execution slot pinned to one physical core and its memory node.
+
+    A worker compiles and then tests on the same slot, so the two never
+    overlap; other slots and the syntax lane live on other physical cores.
+    `memory_mb` is the slot's share of its node memory.
+    """
+
+    def __init__(
+        self,
+        slot_id: int,
+        cpus: List[int],
+        mems: Optional[int] = None,
+        memory_mb: Optional[int] = None
+    ):
+        self.id = slot_id
+        self.cpus = cpus
+        self.mems = mems
+        self.memory_mb = memory_mb
+
+    @property
+    def cpuset(self) -> str:
+        return format_cpu_list(self.cpus)
+
+    @property
+    def cpuset_mems(self) -> Optional[str]:
+        return str(self.mems) if self.mems is not None else None
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "cpus": self.cpuset,
+            "mems": self.cpuset_mems,
+            "memory_mb": self.memory_mb
+        }
+
+
+class HostTopology:
+    def __init__(self, slots: List[CpuSlot], syntax_slot: Optional[CpuSlot] = None):
+        self.slots = slots
+        self.syntax_slot = syntax_slot
+
+
+def parse_cpu_list(value: str) -> List[int]:
+    cpus: List[int] = []
+    for part in value.strip().split(","):
+        if not part:
+            continue
+        if "-" in part:
+            start, end = part.split("-", 1)
+            cpus.extend(range(int(start), int(end) + 1))
+        else:
+            cpus.append(int(part))
+    return cpus
+
+
+def format_cpu_list(cpus: List[int]) -> str:
+    return ",".join(str(cpu) for cpu in sorted(cpus))
+
+
+def available_cpus() -> List[int]:
+    try:
+        return sorted(os.sched_getaffinity(0))
+    except AttributeError:
+        return list(range(os.cpu_count() or 1))
+
+
+def _read_sysfs(path: Path) -> Optional[str]:
+    try:
+        return path.read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def _cpu_nodes(cpus: List[int]) -> Dict[int, Optional[int]]:
+    nodes: Dict[int, Optional[int]] = {cpu: None for cpu in cpus}
+    for node_dir in sorted(SYSFS_NODE_DIR.glob("node[0-9]*")):
+        cpulist = _read_sysfs(node_dir / "cpulist")
+        if cpulist is None:
+            continue
+        node_id = int(node_dir.name[len("node"):])
+        for cpu in parse_cpu_list(cpulist):
+            if cpu in nodes:
+                nodes[cpu] = node_id
+    return nodes
+
+
+def _node_memory_mb(node: Optional[int]) -> Optional[int]:
+    if node is not None:
+        meminfo = _read_sysfs(SYSFS_NODE_DIR / f"node{node}" / "meminfo")
+        for line in (meminfo or "").splitlines():
+            if "MemTotal:" in line:
+                return int(line.split()[-2]) // 1024
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") // (1024 * 1024)
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def _physical_cores(cpus: List[int]) -> List[List[int]]:
+    """Group CPUs into physical cores using hyperthread sibling lists."""
+    cores: List[List[int]] = []
+    seen: set[int] = set()
+    for cpu in cpus:
+        if cpu in seen:
+            continue
+        siblings = _read_sysfs(SYSFS_CPU_DIR / f"cpu{cpu}" / "topology" / "thread_siblings_list")
+        core = [cpu]
+        if siblings is not None:
+            core = [c for c in parse_cpu_list(siblings) if c in cpus and c not in seen] or [cpu]
+        cores.append(core)
+        seen.update(core)
+    return cores
+
+
+def detect_topology(reserve_syntax_core: bool = True) -> HostTopology:
+    """Give every physical core (all of its SMT siblings) to one worker slot.
+
+    When the syntax lane is enabled and the host has at least
+    SYNTAX_CORE_MIN_CORES cores, the last core is reserved for it so
+    `zig ast-check` never runs next to a test. On smaller hosts a whole core
+    is too much to give up for parse-only checks, so the lane runs unpinned.
+    Node memory is split evenly between the slots placed on that node.
+    """
+    cpus = available_cpus()
+    nodes = _cpu_nodes(cpus)
+
+    cores: List[Tuple[Optional[int], List[int]]] = []
+    by_node: Dict[Optional[int], List[int]] = {}
+    for cpu in cpus:
+        by_node.setdefault(nodes[cpu], []).append(cpu)
+    for node, node_cpus in sorted(by_node.items(), key=lambda item: (item[0] is None, item[0] or 0)):
+        cores.extend((node, core) for core in _physical_cores(node_cpus))
+
+    syntax_core = None
+    if reserve_syntax_core and len(cores) >= SYNTAX_CORE_MIN_CORES:
+        syntax_core = cores.pop()
+
+    per_node: Dict[Optional[int], int] = {}
+    for node, _ in cores + ([syntax_core] if syntax_core else []):
+        per_node[node] = per_node.get(node, 0) + 1
+
+    def _budget(node: Optional[int]) -> Optional[int]:
+        memory_mb = _node_memory_mb(node)
+        return memory_mb // per_node[node] if memory_mb else None
+
+    slots = [
+        CpuSlot(slot_id, core, node, _budget(node))
+        for slot_id, (node, core) in enumerate(cores)
+    ]
+    syntax_slot = None
+    if syntax_core:
+        node, core = syntax_core
+        syntax_slot = CpuSlot(len(slots), core, node, _budget(node))
+
+    return HostTopology(slots, syntax_slot)
@@ -3,10 +3,14 @@ set -euo pipefail
 
 BASE_URL="${BASE_URL:-http://127.0.0.1:8000}"
 
-echo "[1/7] health"
-curl -sS "$BASE_URL/health" | python -m json.tool
+echo "[1/8] health"
+HEALTH=$(curl -sS "$BASE_URL/health")
+python -m json.tool <<< "$HEALTH"
+python -c "import json,sys; h=json.load(sys.stdin); assert 'workers' in h['slots'] and 'syntax' in h['slots'], h" <<< "$HEALTH"
+python -c "import json,sys; s=json.load(sys.stdin)['syntax_check']; assert {'checked','rejected','bypassed','saved_time_ms'} <= s.keys(), s" <<< "$HEALTH"
+WORKERS=$(python -c "import json,sys; print(json.load(sys.stdin)['workers'])" <<< "$HEALTH")
 
-echo "[2/7] tasks"
+echo "[2/8] tasks"
 curl -sS "$BASE_URL/tasks" | python -m json.tool
 
 submit() {
@@ -31,24 +35,34 @@ wait_job() {
   exit 1
 }
 
-echo "[3/7] OK verdict"
+echo "[3/8] OK verdict"
 JOB_OK=$(submit '{"task_id":"hello-world","code":"const std = @import(\"std\"); pub fn main() !void { try std.io.getStdOut().writer().print(\"Hello, World!\", .{}); }","mode":"check"}')
 wait_job "$JOB_OK" | python -m json.tool
 
-echo "[4/7] WA verdict"
+echo "[4/8] WA verdict"
 JOB_WA=$(submit '{"task_id":"hello-world","code":"const std = @import(\"std\"); pub fn main() !void { try std.io.getStdOut().writer().print(\"WRONG\", .{}); }","mode":"check"}')
 wait_job "$JOB_WA" | python -m json.tool
 
-echo "[5/7] CE verdict"
+echo "[5/8] CE verdict"
 JOB_CE=$(submit '{"task_id":"hello-world","code":"const std = @import(\"std\"); pub fn main() !void { this is bad zig }","mode":"check"}')
 wait_job "$JOB_CE" | python -m json.tool
 
-echo "[6/7] RE verdict"
+echo "[6/8] RE verdict"
 JOB_RE=$(submit '{"task_id":"hello-world","code":"pub fn main() !void { @panic(\"boom\"); }","mode":"check"}')
 wait_job "$JOB_RE" | python -m json.tool
 
-echo "[7/7] TLE verdict"
+echo "[7/8] TLE verdict"
 JOB_TLE=$(submit '{"task_id":"hello-world","code":"pub fn main() !void { while (true) {} }","mode":"check"}')
 wait_job "$JOB_TLE" | python -m json.tool
 
+echo "[8/8] CE via syntax lane while workers are busy"
+for _ in $(seq 1 "$WORKERS"); do
+  submit '{"task_id":"hello-world","code":"pub fn main() !void { while (true) {} }","mode":"check"}' > /dev/null
+done
+JOB_LANE=$(submit '{"task_id":"hello-world","code":"pub fn main() !void { this is bad zig }","mode":"check"}')
+LANE_BODY=$(wait_job "$JOB_LANE")
+python -m json.tool <<< "$LANE_BODY"
+python -c "import json,sys; r=json.load(sys.stdin)['result']; assert r['verdict'] == 'CE', r" <<< "$LANE_BODY"
+curl -sS "$BASE_URL/health" | python -c "import json,sys; s=json.load(sys.stdin)['syntax_check']; print(s); assert s['rejected'] >= 1, s"
+
 echo "Smoke test finished"